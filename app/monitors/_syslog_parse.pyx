@@ -0,0 +1,229 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled syslog datagram parser.
+
+Optional C implementation of parse_syslog_pri() + parse_syslog_message()
+from syslog_listener. It scans the raw buffer directly instead of using
+regular expressions and returns the same fields. The listener uses it
+when built and falls back to the pure Python parser otherwise.
+
+Build in place with Cython:
+
+    cythonize -i app/monitors/_syslog_parse.pyx
+"""
+
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+
+
+cdef inline bint _is_space(unsigned char c):
+    # Same set as bytes.split() and \s in bytes patterns
+    return c == c' ' or (c'\t' <= c <= c'\r')
+
+
+cdef inline bint _is_digit(unsigned char c):
+    return c'0' <= c <= c'9'
+
+
+cdef inline str _decode(const unsigned char* buf, Py_ssize_t start, Py_ssize_t end):
+    """Decode buf[start:end], replacing invalid UTF-8 sequences."""
+    return PyUnicode_DecodeUTF8(<const char*>buf + start, end - start, "replace")
+
+
+cdef inline Py_ssize_t _skip_space(const unsigned char* buf, Py_ssize_t i, Py_ssize_t n):
+    while i < n and _is_space(buf[i]):
+        i += 1
+    return i
+
+
+cdef inline Py_ssize_t _skip_word(const unsigned char* buf, Py_ssize_t i, Py_ssize_t n):
+    while i < n and not _is_space(buf[i]):
+        i += 1
+    return i
+
+
+cdef Py_ssize_t _structured_data_end(const unsigned char* buf, Py_ssize_t i, Py_ssize_t n):
+    """Index just past the ']' closing the SD element at buf[i], or -1."""
+    cdef Py_ssize_t first_close, depth = 0, j
+
+    # SD elements don't nest, so the first ']' normally closes it
+    first_close = i + 1
+    while first_close < n and buf[first_close] != c']':
+        if buf[first_close] == c'[':
+            break
+        first_close += 1
+    if first_close == n:
+        return -1
+    if buf[first_close] == c']':
+        return first_close + 1
+
+    # A '[' inside the element, count to the matching bracket
+    for j in range(i, n):
+        if buf[j] == c'[':
+            depth += 1
+        elif buf[j] == c']':
+            depth -= 1
+            if depth == 0:
+                return j + 1
+    return -1
+
+
+cdef tuple _parse_rfc5424(const unsigned char* buf, Py_ssize_t start, Py_ssize_t n):
+    """Parse an RFC 5424 header at buf[start:], or return None if malformed."""
+    cdef Py_ssize_t fields[6][2]
+    cdef Py_ssize_t i = start, k, end
+
+    # VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID, then the remainder
+    for k in range(6):
+        i = _skip_space(buf, i, n)
+        fields[k][0] = i
+        i = _skip_word(buf, i, n)
+        fields[k][1] = i
+        if fields[k][0] == i:
+            return None
+    i = _skip_space(buf, i, n)
+    if i == n:
+        return None
+
+    if fields[2][1] - fields[2][0] == 1 and buf[fields[2][0]] == c'-':
+        hostname = "unknown"
+    else:
+        hostname = _decode(buf, fields[2][0], fields[2][1])
+
+    if fields[3][1] - fields[3][0] == 1 and buf[fields[3][0]] == c'-':
+        app_name = "unknown"
+    else:
+        app_name = _decode(buf, fields[3][0], fields[3][1])
+
+    # STRUCTURED-DATA is nil (-)
+    if i + 1 < n and buf[i] == c'-' and buf[i + 1] == c' ':
+        i += 2
+    # STRUCTURED-DATA starts with [
+    elif buf[i] == c'[':
+        end = _structured_data_end(buf, i, n)
+        if 0 < end < n:
+            i = _skip_space(buf, end, n)
+        else:
+            i = n
+
+    return hostname, app_name, _decode(buf, i, n)
+
+
+cdef tuple _parse_rfc3164(const unsigned char* buf, Py_ssize_t start, Py_ssize_t n):
+    """Parse an RFC 3164 header at buf[start:], or return None if it doesn't match."""
+    cdef Py_ssize_t i = start, j, digits, host_start, host_end, msg_end
+
+    # Mmm dd hh:mm:ss
+    if n - i < 3:
+        return None
+    if not (c'A' <= buf[i] <= c'Z' and c'a' <= buf[i + 1] <= c'z' and c'a' <= buf[i + 2] <= c'z'):
+        return None
+    i += 3
+
+    j = _skip_space(buf, i, n)
+    if j == i:
+        return None
+    i = j
+
+    digits = 0
+    while i < n and _is_digit(buf[i]):
+        i += 1
+        digits += 1
+    if digits == 0 or digits > 2:
+        return None
+
+    j = _skip_space(buf, i, n)
+    if j == i:
+        return None
+    i = j
+
+    if n - i < 8:
+        return None
+    for j in (0, 1, 3, 4, 6, 7):
+        if not _is_digit(buf[i + j]):
+            return None
+    if buf[i + 2] != c':' or buf[i + 5] != c':':
+        return None
+    i += 8
+
+    # HOSTNAME
+    j = _skip_space(buf, i, n)
+    if j == i:
+        return None
+    host_start = j
+    host_end = _skip_word(buf, host_start, n)
+    if host_end == host_start:
+        return None
+
+    # MESSAGE, which may not contain line breaks except a trailing one
+    i = _skip_space(buf, host_end, n)
+    if i == host_end:
+        return None
+    msg_end = n
+    if msg_end > i and buf[msg_end - 1] == c'\n':
+        msg_end -= 1
+    for j in range(i, msg_end):
+        if buf[j] == c'\n':
+            return None
+
+    hostname = _decode(buf, host_start, host_end)
+
+    # Try to extract app name: "appname[pid]: message" or "appname: message"
+    app_name = "unknown"
+    for j in range(i + 1, msg_end):
+        if _is_space(buf[j - 1]):
+            break
+
+        if buf[j] == c':':
+            app_name = _decode(buf, i, j)
+            i = _skip_space(buf, j + 1, msg_end)
+            break
+
+        if buf[j] == c'[':
+            digits = j + 1
+            while digits < msg_end and _is_digit(buf[digits]):
+                digits += 1
+            if (digits > j + 1 and digits + 1 < msg_end
+                    and buf[digits] == c']' and buf[digits + 1] == c':'):
+                app_name = _decode(buf, i, j)
+                i = _skip_space(buf, digits + 2, msg_end)
+                break
+
+    return hostname, app_name, _decode(buf, i, msg_end)
+
+
+cpdef tuple parse(bytes data):
+    """
+    Parse a raw syslog datagram.
+
+    Returns: (hostname, app_name, actual_message_text, severity, facility)
+    where severity and facility are None if there is no valid PRI
+    """
+    cdef const unsigned char* buf = data
+    cdef Py_ssize_t n = len(data)
+    cdef Py_ssize_t start = 0, end
+    cdef int pri = 0
+
+    facility = None
+    severity = None
+
+    # PRI is "<" + 1-3 digits + ">"
+    if n and buf[0] == c'<':
+        end = 1
+        while end < n and end < 4 and _is_digit(buf[end]):
+            pri = pri * 10 + (buf[end] - c'0')
+            end += 1
+        if end > 1 and end < n and buf[end] == c'>':
+            facility = pri >> 3
+            severity = pri & 7
+            start = end + 1
+
+    if n - start >= 2 and buf[start] == c'1' and buf[start + 1] == c' ':
+        parsed = _parse_rfc5424(buf, start, n)
+    else:
+        parsed = _parse_rfc3164(buf, start, n)
+
+    if parsed is None:
+        # Unknown format, return the whole thing as the message
+        parsed = ("unknown", "unknown", _decode(buf, start, n))
+
+    return parsed + (severity, facility)
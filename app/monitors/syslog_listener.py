@@ -1,11 +1,24 @@
 #!/usr/bin/env python3
 """Syslog UDP listener for collecting log messages."""
 
+import ctypes
+import errno
+import logging
+import os
 import socket
 import re
-from datetime import datetime
+import selectors
+import sys
+import threading
+import time
+from collections import deque
 
 
+# Per-packet output goes through this logger. It is left unconfigured here;
+# the application entry point (main.setup_logging) sends it to a background
+# thread so terminal I/O stays out of the receive loop.
+logger = logging.getLogger(__name__)
+
 # Syslog severity levels
 SEVERITY_NAMES = {
     0: "Emergency",
@@ -18,13 +31,95 @@ SEVERITY_NAMES = {
     7: "Debug"
 }
 
+# Same names indexed by severity, for the per-packet lookup
+_SEVERITY_NAMES = tuple(SEVERITY_NAMES[severity] for severity in range(8))
+
 # High severity levels that should trigger alerts
-HIGH_SEVERITY = [0, 1, 2, 3]  # Emergency, Alert, Critical, Error
+HIGH_SEVERITY = frozenset((0, 1, 2, 3))  # Emergency, Alert, Critical, Error
+
+# Number of high severity messages kept in state['recent_alerts']
+MAX_RECENT_ALERTS = 100
+
+# Kernel receive buffer requested for the listener socket. Large enough to
+# absorb bursts while the listener thread is busy; the kernel caps it at
+# net.core.rmem_max, so raise that sysctl to get the full size.
+SOCKET_RCVBUF_SIZE = 8 * 1024 * 1024
+
+# Largest UDP payload; RFC 5424 messages may be well over 1024 bytes.
+# Reads of this size can't truncate an IPv4 datagram (max payload 65507).
+MAX_DATAGRAM_SIZE = 65535
+
+# Datagrams fetched per recvmmsg(2) call on Linux
+RECV_BATCH_SIZE = 32
+
+# Under sustained load (full batches without alerts) the message count is
+# added to state at most every this many batches; see _receive_loop
+STATS_FLUSH_BATCHES = 16
+
+# Precompiled patterns, reused for every received packet.
+# These run on the raw datagram bytes; only the extracted fields are decoded.
+_RFC3164_RE = re.compile(rb'^([A-Z][a-z]{2}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(.*)$')
+_APP_RE = re.compile(rb'^(\S+?)(?:\[\d+\])?:\s*(.*)$')
+
+
+class LogEntry:
+    """
+    One received syslog message, as stored in state['recent_alerts'].
+
+    Uses __slots__ to keep per-message allocation small; as_dict() gives
+    the plain dict form for serialization.
+    """
+
+    __slots__ = ('timestamp', 'source', 'hostname', 'app_name',
+                 'facility', 'severity', 'severity_name', 'message')
+
+    def __init__(self, timestamp, source, hostname, app_name, facility, severity, severity_name, message):
+        self.timestamp = timestamp
+        self.source = source
+        self.hostname = hostname
+        self.app_name = app_name
+        self.facility = facility
+        self.severity = severity
+        self.severity_name = severity_name
+        self.message = message
+
+    def as_dict(self):
+        """Return the entry as a plain dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"LogEntry({self.as_dict()!r})"
+
+
+# Per-thread cache of the formatted current second, see _timestamp()
+_timestamp_cache = threading.local()
+
+
+def _timestamp():
+    """
+    Current local time in ISO 8601 format with microseconds.
+
+    The date and time part is formatted at most once per second per thread;
+    only the microseconds are formatted on every call.
+    """
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+
+    cache = _timestamp_cache
+    if getattr(cache, 'seconds', None) != seconds:
+        cache.prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        cache.seconds = seconds
+
+    return f"{cache.prefix}.{nanoseconds // 1000:06d}"
+
+
+def _decode(raw):
+    """Decode a parsed field to text, replacing invalid UTF-8 sequences."""
+    return raw.decode('utf-8', errors='replace')
 
 
 def parse_syslog_pri(message):
     """
-    Parse syslog priority from message.
+    Parse syslog priority from a raw (bytes) message.
 
     Syslog messages start with <PRI> where PRI is a number.
     Facility = PRI / 8
@@ -32,26 +127,50 @@ def parse_syslog_pri(message):
 
     Returns: (facility, severity, message_without_pri) or (None, None, message)
     """
-    # Match <NNN> at the start of the message
-    pri_match = re.match(r'^<(\d+)>(.*)$', message)
+    # PRI is "<" + 1-3 digits + ">", so a short scan is enough
+    if message[:1] != b'<':
+        return None, None, message
+
+    end = message.find(b'>', 1, 5)
+    if end == -1:
+        return None, None, message
+
+    pri_digits = message[1:end]
+    if not pri_digits.isdigit():
+        return None, None, message
+
+    pri = int(pri_digits)
 
-    if pri_match:
-        pri = int(pri_match.group(1))
-        remaining_message = pri_match.group(2)
+    facility = pri >> 3
+    severity = pri & 7
 
-        facility = pri // 8
-        severity = pri % 8
+    return facility, severity, message[end + 1:]
 
-        return facility, severity, remaining_message
 
-    return None, None, message
+def _structured_data_end(remainder):
+    """
+    Find the end of a bracketed STRUCTURED-DATA element by counting brackets.
+
+    Returns: index just past the matching ']', or 0 if it is never closed
+    """
+    bracket_count = 0
+    for i, char in enumerate(remainder):
+        if char == 0x5B:  # '['
+            bracket_count += 1
+        elif char == 0x5D:  # ']'
+            bracket_count -= 1
+            if bracket_count == 0:
+                return i + 1
+
+    return 0
 
 
 def parse_syslog_message(message_without_pri):
     """
     Parse syslog message to extract actual message text.
 
-    Handles both RFC 5424 and RFC 3164 formats.
+    Works on the raw bytes left after the PRI and decodes only the
+    extracted fields. Handles both RFC 5424 and RFC 3164 formats.
 
     RFC 5424: VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID STRUCTURED-DATA MSG
     RFC 3164: Mmm dd hh:mm:ss HOSTNAME MESSAGE
@@ -59,9 +178,11 @@ def parse_syslog_message(message_without_pri):
     Returns: (hostname, app_name, actual_message_text)
     """
     # Check if it's RFC 5424 format (starts with version number, typically "1 ")
-    if message_without_pri.startswith("1 "):
+    if message_without_pri.startswith(b"1 "):
         # RFC 5424 format
-        # First get the basic fields (up to MSGID)
+        # First get the basic fields (up to MSGID). A single C-level split is
+        # faster than scanning field offsets with find() from Python; the
+        # compiled _syslog_parse module does the single-pass offset scan.
         parts = message_without_pri.split(None, 6)  # Split first 6 fields
 
         if len(parts) >= 7:
@@ -73,152 +194,511 @@ def parse_syslog_message(message_without_pri):
             # parts[5] = MSGID
             # parts[6] = STRUCTURED-DATA + MSG (remainder)
 
-            hostname = parts[2] if parts[2] != "-" else "unknown"
-            app_name = parts[3] if parts[3] != "-" else "unknown"
+            # Plain != is already the cheap test for the "-" nil value: bytes
+            # comparison rejects a length mismatch before looking at content
+            hostname = _decode(parts[2]) if parts[2] != b"-" else "unknown"
+            app_name = _decode(parts[3]) if parts[3] != b"-" else "unknown"
 
             # Now handle STRUCTURED-DATA and MSG
             remainder = parts[6]
 
             # If STRUCTURED-DATA is nil (-)
-            if remainder.startswith("- "):
+            if remainder.startswith(b"- "):
                 actual_message = remainder[2:]  # Skip "- " prefix
             # If STRUCTURED-DATA starts with [
-            elif remainder.startswith("["):
-                # Find the end of structured data (matching closing bracket)
-                bracket_count = 0
-                end_index = 0
-                for i, char in enumerate(remainder):
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            end_index = i + 1
-                            break
+            elif remainder.startswith(b"["):
+                # Find the end of structured data. SD elements don't nest, so
+                # the first ']' normally closes it.
+                end_index = remainder.find(b']', 1) + 1
+                if end_index and remainder.find(b'[', 1, end_index) != -1:
+                    # A '[' inside the element, count to the matching bracket
+                    end_index = _structured_data_end(remainder)
 
                 # Extract message after structured data
                 if end_index > 0 and end_index < len(remainder):
                     actual_message = remainder[end_index:].lstrip()
                 else:
-                    actual_message = ""
+                    actual_message = b""
             else:
                 # No structured data, remainder is the message
                 actual_message = remainder
 
-            return hostname, app_name, actual_message
+            return hostname, app_name, _decode(actual_message)
 
         # Malformed RFC 5424, return what we have
-        return "unknown", "unknown", message_without_pri
+        return "unknown", "unknown", _decode(message_without_pri)
 
     # Try RFC 3164 format (legacy)
     # Pattern: Mmm dd hh:mm:ss HOSTNAME MESSAGE
-    rfc3164_match = re.match(r'^([A-Z][a-z]{2}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(.*)$', message_without_pri)
+    rfc3164_match = _RFC3164_RE.match(message_without_pri)
 
     if rfc3164_match:
-        timestamp = rfc3164_match.group(1)
-        hostname = rfc3164_match.group(2)
+        hostname = _decode(rfc3164_match.group(2))
         message_text = rfc3164_match.group(3)
 
         # Try to extract app name from message (format: "appname[pid]: message" or "appname: message")
-        app_match = re.match(r'^(\S+?)(?:\[\d+\])?:\s*(.*)$', message_text)
+        app_match = _APP_RE.match(message_text)
         if app_match:
-            app_name = app_match.group(1)
+            app_name = _decode(app_match.group(1))
             actual_message = app_match.group(2)
         else:
             app_name = "unknown"
             actual_message = message_text
 
-        return hostname, app_name, actual_message
+        return hostname, app_name, _decode(actual_message)
 
     # Unknown format, return the whole thing as the message
-    return "unknown", "unknown", message_without_pri
+    return "unknown", "unknown", _decode(message_without_pri)
 
 
-def start_syslog_listener(state_manager, host="0.0.0.0", port=514):
+def _parse_datagram(data):
     """
-    Start UDP syslog listener.
+    Parse a raw syslog datagram.
 
-    Args:
-        state_manager: StateManager instance for thread-safe state access
-        host: IP address to bind to (default: 0.0.0.0 for all interfaces)
-        port: UDP port to listen on (default: 514)
+    Pure Python version; replaced below by the compiled _syslog_parse.parse
+    when that extension has been built.
+
+    Returns: (hostname, app_name, actual_message_text, severity, facility)
+    """
+    facility, severity, message_without_pri = parse_syslog_pri(data)
+    hostname, app_name, actual_message = parse_syslog_message(message_without_pri)
+
+    return hostname, app_name, actual_message, severity, facility
+
+
+try:
+    from ._syslog_parse import parse as _parse_datagram
+except ImportError:
+    pass
+
+
+# recvmmsg(2) structures (Linux). Each message slot gets its own iovec,
+# data buffer and sockaddr buffer; the kernel fills as many as are queued.
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _MsgHdr),
+        ('msg_len', ctypes.c_uint),
+    ]
+
+
+_MSG_WAITFORONE = 0x10000
+_SOCKADDR_SIZE = 128  # sizeof(struct sockaddr_storage)
+
+
+def _load_recvmmsg():
+    """Return libc's recvmmsg, or None where it is unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        recvmmsg = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (OSError, AttributeError):
+        return None
+
+    recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+
+_recvmmsg = _load_recvmmsg()
+
+
+class _BatchReceiver:
+    """Receive several datagrams per system call with recvmmsg(2)."""
+
+    def __init__(self, sock, batch_size=RECV_BATCH_SIZE, bufsize=MAX_DATAGRAM_SIZE):
+        self._fd = sock.fileno()
+        self._batch_size = batch_size
+        self._bufsize = bufsize
+
+        self._buffers = ctypes.create_string_buffer(bufsize * batch_size)
+        self._addrs = ctypes.create_string_buffer(_SOCKADDR_SIZE * batch_size)
+        self._iovecs = (_IOVec * batch_size)()
+        self._msgs = (_MMsgHdr * batch_size)()
+
+        self._buf_base = ctypes.addressof(self._buffers)
+        self._addr_base = ctypes.addressof(self._addrs)
+
+        for i in range(batch_size):
+            self._iovecs[i].iov_base = self._buf_base + i * bufsize
+            self._iovecs[i].iov_len = bufsize
+
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = self._addr_base + i * _SOCKADDR_SIZE
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+            hdr.msg_namelen = _SOCKADDR_SIZE
+
+        # Slots the last call filled, whose msg_namelen the kernel overwrote
+        self._filled = 0
+
+    def receive(self):
+        """
+        Block until at least one datagram arrives, then drain up to a batch.
+
+        Returns: list of (data, (ip, port)) tuples
+        """
+        msgs = self._msgs
+        for i in range(self._filled):
+            # The kernel overwrites namelen with the actual address length
+            msgs[i].msg_hdr.msg_namelen = _SOCKADDR_SIZE
+
+        while True:
+            count = _recvmmsg(self._fd, msgs, self._batch_size, _MSG_WAITFORONE, None)
+            if count >= 0:
+                break
+
+            # Retry after a signal, as socket methods do (PEP 475)
+            err = ctypes.get_errno()
+            if err != errno.EINTR:
+                raise OSError(err, os.strerror(err))
+        self._filled = count
+
+        packets = []
+        for i in range(count):
+            data = ctypes.string_at(self._buf_base + i * self._bufsize, msgs[i].msg_len)
+
+            # struct sockaddr_in: family (2 bytes), port, IPv4 address
+            raw_addr = ctypes.string_at(self._addr_base + i * _SOCKADDR_SIZE + 2, 6)
+            addr = (socket.inet_ntoa(raw_addr[2:]), int.from_bytes(raw_addr[:2], 'big'))
+
+            packets.append((data, addr))
+
+        return packets
+
+
+def _make_receiver(sock):
+    """
+    Pick the fastest way to read datagrams from sock.
+
+    Returns: callable returning a list of (data, addr) tuples
+    """
+    if _recvmmsg is not None:
+        return _BatchReceiver(sock).receive
+
+    def receive():
+        # recvfrom() allocates a full-size buffer per call, but that is
+        # cheaper than recvfrom_into() a reused bytearray plus copying the
+        # datagram out as bytes for the parser
+        return [sock.recvfrom(MAX_DATAGRAM_SIZE)]
+
+    return receive
+
+
+# Linux socket option asking the kernel to steer a SO_REUSEPORT group's
+# datagrams to the socket whose SO_INCOMING_CPU matches the receiving CPU
+_SO_INCOMING_CPU = getattr(socket, 'SO_INCOMING_CPU', 49)
+
+
+def _pin_to_cpu(cpu):
+    """Restrict the calling thread to one CPU, where supported."""
+    if not hasattr(os, 'sched_setaffinity'):
+        logger.warning("CPU affinity not supported, not pinning")
+        return
+
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError as e:
+        logger.warning("Could not pin to CPU %s: %s", cpu, e)
+
+
+def _open_socket(host, port, reuse_port=False, cpu=None):
     """
-    print(f"[Syslog Listener] Starting on {host}:{port}")
+    Create and bind a UDP socket for the syslog listener.
 
-    # Create UDP socket
+    Args:
+        host: IP address to bind to
+        port: UDP port to bind to
+        reuse_port: Set SO_REUSEPORT so several sockets can share the port
+        cpu: Optional CPU whose incoming datagrams this socket should get
+
+    Returns: bound socket
+    """
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
     try:
+        if reuse_port:
+            # Let the kernel spread datagrams across all sockets on this port
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+        if cpu is not None and sys.platform.startswith('linux'):
+            # Keep packet data on the CPU that will parse it
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, _SO_INCOMING_CPU, cpu)
+            except OSError as e:
+                logger.warning("Could not set SO_INCOMING_CPU %s: %s", cpu, e)
+
+        # Enlarge the receive buffer so bursts are queued instead of dropped
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)
+        rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        print(f"[Syslog Listener] Receive buffer: {rcvbuf} bytes (requested {SOCKET_RCVBUF_SIZE})")
+
         sock.bind((host, port))
-        print(f"[Syslog Listener] Bound to {host}:{port}")
+    except Exception:
+        sock.close()
+        raise
 
-        # Initialize stats in state
-        with state_manager.state_lock() as state:
-            if 'stats' not in state:
-                state['stats'] = {}
-            state['stats']['syslog_count'] = 0
+    return sock
+
+
+def _handle_packet(data, addr):
+    """
+    Parse and log one syslog datagram. Touches no shared state.
+
+    Args:
+        data: Raw datagram bytes
+        addr: (ip, port) of the sender
+
+    Returns: LogEntry if the message is high severity, else None
+    """
+    # Parse priority and message format straight from the raw bytes
+    hostname, app_name, actual_message, severity, facility = _parse_datagram(data)
+
+    # Only high severity messages become alerts (None is never a member)
+    if severity in HIGH_SEVERITY:
+        timestamp = _timestamp()
+        severity_name = _SEVERITY_NAMES[severity]
+
+        log_entry = LogEntry(
+            timestamp,
+            f"{addr[0]}:{addr[1]}",
+            hostname,
+            app_name,
+            facility,
+            severity,
+            severity_name,
+            actual_message
+        )
+
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("%s [%s] %s - %s", timestamp, severity_name, hostname, actual_message[:80])
+        return log_entry
+
+    # Everything else is only logged, so skip the entry and, when INFO is
+    # disabled, the timestamp and severity name too
+    if logger.isEnabledFor(logging.INFO):
+        # parse_syslog_pri only yields 0-7 or None
+        severity_name = _SEVERITY_NAMES[severity] if severity is not None else "Unknown"
+        logger.info("%s [%s] %s - %s", _timestamp(), severity_name, hostname, actual_message[:80])
+
+    return None
+
+
+def _make_waiter(socks):
+    """
+    Build the blocking "wait for datagrams" call for one worker's sockets.
+
+    A single socket is read directly. Several sockets are made non-blocking
+    and multiplexed with a selector (epoll on Linux), so one thread serves
+    all of them.
+
+    Returns: callable returning a list of (data, addr) tuples
+    """
+    if len(socks) == 1:
+        return _make_receiver(socks[0])
+
+    selector = selectors.DefaultSelector()
+    for sock in socks:
+        sock.setblocking(False)
+        selector.register(sock, selectors.EVENT_READ, _make_receiver(sock))
+
+    def wait():
+        packets = []
+        for key, _ in selector.select():
+            try:
+                packets.extend(key.data())
+            except BlockingIOError:
+                # Readiness can be spurious, e.g. a datagram failed its checksum
+                pass
+        return packets
+
+    return wait
+
+
+def _receive_loop(socks, state_manager, cpu=None):
+    """
+    Receive and process syslog datagrams from a worker's sockets.
 
-            if 'recent_alerts' not in state:
-                state['recent_alerts'] = []
+    Errors receiving, parsing or updating state are logged and the loop
+    keeps going. The sockets are closed if the loop ever exits, so the
+    kernel stops routing SO_REUSEPORT traffic to a dead worker.
+
+    Parsing happens outside the state lock. The lock is taken to add the
+    message count and any new alerts when a batch has alerts or no more
+    datagrams are queued, and otherwise only every STATS_FLUSH_BATCHES
+    batches, so plain traffic under load rarely touches it and the count
+    is current again before the loop blocks waiting for more.
+
+    Args:
+        socks: Bound UDP sockets served by this thread
+        state_manager: StateManager instance for thread-safe state access
+        cpu: Optional CPU to pin this thread to
+    """
+    try:
+        if cpu is not None:
+            _pin_to_cpu(cpu)
+
+        receive = _make_waiter(socks)
+
+        # Zero-timeout readiness probe for deferring the state update. Unlike
+        # select.select(), a selector has no FD_SETSIZE limit on fd numbers.
+        queued = selectors.DefaultSelector()
+        for sock in socks:
+            queued.register(sock, selectors.EVENT_READ)
+
+        # Messages counted but not yet added to state, and full batches since
+        pending_count = 0
+        deferred_batches = 0
 
-        # Main receive loop
         while True:
             try:
-                # Receive data (max 1024 bytes)
-                data, addr = sock.recvfrom(1024)
+                # Receive a batch of datagrams (a single one without recvmmsg)
+                packets = receive()
+            except Exception as e:
+                logger.warning("Error receiving packets: %s", e)
+                continue
 
-                # Decode to text, handling UTF-8 errors gracefully
+            count = 0
+            alerts = []
+            for data, addr in packets:
                 try:
-                    message = data.decode('utf-8')
-                except UnicodeDecodeError:
-                    # Fall back to latin-1 or ignore errors
-                    message = data.decode('utf-8', errors='ignore')
-
-                # Parse syslog priority
-                facility, severity, message_without_pri = parse_syslog_pri(message)
-
-                # Parse the syslog message format to extract actual message text
-                hostname, app_name, actual_message = parse_syslog_message(message_without_pri)
-
-                # Prepare log entry
-                timestamp = datetime.now().isoformat()
-                severity_name = SEVERITY_NAMES.get(severity, "Unknown") if severity is not None else "Unknown"
-
-                log_entry = {
-                    'timestamp': timestamp,
-                    'source': f"{addr[0]}:{addr[1]}",
-                    'hostname': hostname,
-                    'app_name': app_name,
-                    'facility': facility,
-                    'severity': severity,
-                    'severity_name': severity_name,
-                    'message': actual_message
-                }
+                    log_entry = _handle_packet(data, addr)
+                except Exception as e:
+                    # Handle exceptions to prevent crash on bad packets
+                    logger.warning("Error processing packet: %s", e)
+                    continue
+
+                count += 1
+                if log_entry is not None:
+                    alerts.append(log_entry)
+
+            pending_count += count
+            if not pending_count:
+                continue
+
+            try:
+                # Only defer when more datagrams are already queued, otherwise
+                # the next receive() blocks with the count still pending
+                if (not alerts and len(packets) >= RECV_BATCH_SIZE
+                        and deferred_batches < STATS_FLUSH_BATCHES
+                        and queued.select(0)):
+                    deferred_batches += 1
+                    continue
 
                 # Update state with thread-safe locking
                 with state_manager.state_lock() as state:
-                    # Increment counter
-                    state['stats']['syslog_count'] += 1
+                    state['stats']['syslog_count'] += pending_count
+
+                    # Bounded deque, the oldest alerts drop off automatically
+                    state['recent_alerts'].extend(alerts)
+            except Exception as e:
+                # A bad state only loses this update, not the worker
+                logger.warning("Error updating state: %s", e)
 
-                    # Add to recent alerts if high severity
-                    if severity is not None and severity in HIGH_SEVERITY:
-                        state['recent_alerts'].append(log_entry)
+            pending_count = 0
+            deferred_batches = 0
+    finally:
+        for sock in socks:
+            sock.close()
 
-                        # Keep only last 100 alerts
-                        if len(state['recent_alerts']) > 100:
-                            state['recent_alerts'] = state['recent_alerts'][-100:]
 
-                        print(f"{timestamp} [{severity_name}] {hostname} - {actual_message[:80]}")
-                    else:
-                        print(f"{timestamp} [{severity_name}] {hostname} - {actual_message[:80]}")
+def start_syslog_listener(state_manager, host="0.0.0.0", port=514, num_workers=1, addresses=None, cpus=None):
+    """
+    Start UDP syslog listener.
 
-            except Exception as e:
-                # Handle exceptions to prevent crash on bad packets
-                print(f"[Syslog Listener] Error processing packet: {e}")
-                continue
+    With num_workers > 1, each worker binds its own socket to every listen
+    address with SO_REUSEPORT and drains them from its own thread; the
+    kernel distributes incoming datagrams between workers. A worker with
+    several addresses serves all of its sockets from one thread through a
+    selector. The calling thread runs the first worker and blocks.
+
+    With cpus, worker i is pinned to cpus[i % len(cpus)] and its sockets
+    set SO_INCOMING_CPU to match (Linux), so a datagram is parsed on the
+    CPU that received it. Match the list to the NIC queue IRQ affinity.
+
+    Args:
+        state_manager: StateManager instance for thread-safe state access
+        host: IP address to bind to (default: 0.0.0.0 for all interfaces)
+        port: UDP port to listen on (default: 514)
+        num_workers: Number of receiving threads (default: 1)
+        addresses: Optional list of (host, port) tuples to listen on
+                   instead of host/port
+        cpus: Optional list of CPU numbers to pin workers to
+    """
+    if not addresses:
+        addresses = [(host, port)]
+    listen = ", ".join(f"{addr_host}:{addr_port}" for addr_host, addr_port in addresses)
+
+    print(f"[Syslog Listener] Starting on {listen}")
+
+    if num_workers > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+        print("[Syslog Listener] SO_REUSEPORT not supported, using a single worker")
+        num_workers = 1
+
+    # Sockets not yet handed to a worker, which closes its own on exit
+    sockets = []
+    worker_sockets = []
+
+    try:
+        # Create UDP sockets, one per address for each worker
+        worker_cpus = [cpus[i % len(cpus)] if cpus else None for i in range(num_workers)]
+        for cpu in worker_cpus:
+            socks = []
+            for addr_host, addr_port in addresses:
+                sock = _open_socket(addr_host, addr_port, reuse_port=num_workers > 1, cpu=cpu)
+                sockets.append(sock)
+                socks.append(sock)
+            worker_sockets.append(socks)
+        print(f"[Syslog Listener] Bound to {listen} ({num_workers} worker(s))")
+
+        # Initialize stats in state
+        with state_manager.state_lock() as state:
+            if 'stats' not in state:
+                state['stats'] = {}
+            state['stats']['syslog_count'] = 0
+
+            # Keep any alerts already present, but bounded to MAX_RECENT_ALERTS.
+            # Consumers that need a list (e.g. for JSON) should use list().
+            state['recent_alerts'] = deque(state.get('recent_alerts', ()), maxlen=MAX_RECENT_ALERTS)
+
+        # Extra workers run in daemon threads, the first one runs here
+        for i, socks in enumerate(worker_sockets[1:], start=1):
+            worker = threading.Thread(
+                target=_receive_loop,
+                args=(socks, state_manager, worker_cpus[i]),
+                name=f"syslog-worker-{i}",
+                daemon=True
+            )
+            worker.start()
+            for sock in socks:
+                sockets.remove(sock)
+
+        # Main receive loop, which closes worker 0's sockets itself
+        sockets.clear()
+        _receive_loop(worker_sockets[0], state_manager, worker_cpus[0])
 
     except Exception as e:
         print(f"[Syslog Listener] Fatal error: {e}")
     finally:
-        sock.close()
+        for sock in sockets:
+            sock.close()
         print("[Syslog Listener] Stopped")
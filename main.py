@@ -1,4 +1,33 @@
 #!/usr/bin/env python3
 
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+def setup_logging(level=logging.INFO):
+    """
+    Send log output to stderr through a queue drained by a background thread.
+
+    Monitors log per message, so handlers that write to the terminal run on
+    the listener thread instead of in their receive loops. Does nothing if
+    the root logger already has handlers.
+    """
+    root = logging.getLogger()
+    if root.hasHandlers():
+        return
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+
 if __name__ == "__main__":
+    setup_logging()
     print("Homelab Monitor - Starting...")
@@ -5,6 +5,7 @@ import sys
 import threading
 sys.path.insert(0, '.')
 
+from main import setup_logging
 from test_locking import StateManager
 from app.monitors.syslog_listener import start_syslog_listener
 
@@ -13,6 +14,9 @@ def main():
     print("Starting Syslog Listener Test\n")
     print("Press Ctrl+C to stop\n")
 
+    # Print each received message through the queued log handler
+    setup_logging()
+
     # Create state manager
     state_manager = StateManager()
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Test script to check syslog counts and alerts over loopback for different batch sizes."""
+
+import contextlib
+import io
+import logging
+import socket
+import threading
+import time
+from collections import deque
+
+from test_locking import StateManager
+from app.monitors import syslog_listener
+
+
+INFO_MESSAGE = b"<14>Oct 11 22:14:15 host app: info %d"
+ALERT_MESSAGE = b"<11>Oct 11 22:14:15 host app: alert %d"
+
+
+def run_case(num_messages, alerts, num_sockets):
+    """
+    Queue datagrams before the worker starts, so it sees them in full
+    batches, then wait for the worker to add them to state.
+
+    Returns: (syslog_count, number of recent alerts)
+    """
+    state_manager = StateManager()
+    with state_manager.state_lock() as state:
+        state['stats'] = {'syslog_count': 0}
+        state['recent_alerts'] = deque(maxlen=syslog_listener.MAX_RECENT_ALERTS)
+
+    # Skip the receive buffer size line printed for every socket
+    with contextlib.redirect_stdout(io.StringIO()):
+        socks = [syslog_listener._open_socket("127.0.0.1", 0) for _ in range(num_sockets)]
+    message = ALERT_MESSAGE if alerts else INFO_MESSAGE
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    for i in range(num_messages):
+        sender.sendto(message % i, socks[i % num_sockets].getsockname())
+    sender.close()
+
+    worker = threading.Thread(
+        target=syslog_listener._receive_loop,
+        args=(socks, state_manager),
+        daemon=True
+    )
+    worker.start()
+
+    # Give a stuck count time to show, but stop early once it is complete
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        with state_manager.state_lock() as state:
+            if state['stats']['syslog_count'] >= num_messages:
+                break
+        time.sleep(0.05)
+
+    with state_manager.state_lock() as state:
+        return state['stats']['syslog_count'], len(state['recent_alerts'])
+
+
+def main():
+    print("Testing syslog counts over loopback\n")
+
+    # Only counts are checked here, not the per-message log output
+    logging.getLogger(syslog_listener.__name__).setLevel(logging.ERROR)
+
+    receivers = [("recvfrom", None)]
+    if syslog_listener._recvmmsg is not None:
+        receivers.insert(0, ("recvmmsg", syslog_listener._recvmmsg))
+
+    failures = 0
+    for receiver_name, recvmmsg in receivers:
+        syslog_listener._recvmmsg = recvmmsg
+
+        for num_sockets in (1, 2):
+            for num_messages in (1, syslog_listener.RECV_BATCH_SIZE, 2 * syslog_listener.RECV_BATCH_SIZE):
+                for alerts in (False, True):
+                    count, recent = run_case(num_messages, alerts, num_sockets)
+                    expected_recent = num_messages if alerts else 0
+
+                    result = f"count={count} alerts={recent}"
+                    case = (f"{receiver_name}, {num_sockets} socket(s), {num_messages} "
+                            f"{'alert' if alerts else 'info'} message(s)")
+                    if count == num_messages and recent == expected_recent:
+                        print(f"✓ {case}: {result}")
+                    else:
+                        failures += 1
+                        print(f"✗ {case}: {result}, expected count={num_messages} alerts={expected_recent}")
+
+    if failures == 0:
+        print("\n✓ SUCCESS: All counts and alerts match!")
+    else:
+        print(f"\n✗ FAILURE: {failures} cases with wrong counts or alerts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Test script to check the syslog parser against known datagrams and the compiled parser."""
+
+import random
+
+from app.monitors.syslog_listener import parse_syslog_message, parse_syslog_pri
+
+try:
+    from app.monitors._syslog_parse import parse as compiled_parse
+except ImportError:
+    compiled_parse = None
+
+
+# (datagram, expected (hostname, app_name, message, severity, facility))
+EXPECTED = [
+    (b'<34>1 2003-10-11T22:14:15.003Z mymachine.example.com su - ID47 - BOM\'su root\' failed',
+     ("mymachine.example.com", "su", "BOM'su root' failed", 2, 4)),
+    (b'<165>1 2003-10-11T22:14:15.003Z host app 1234 ID47 [exampleSDID@32473 iut="3"] An application event',
+     ("host", "app", "An application event", 5, 20)),
+    (b'<13>1 2003-10-11T22:14:15Z - - - - - no host or app',
+     ("unknown", "unknown", "no host or app", 5, 1)),
+    (b'<13>1 2003-10-11T22:14:15Z host app - - [a b="[x]"] nested bracket',
+     ("host", "app", "nested bracket", 5, 1)),
+    (b'<13>1 2003-10-11T22:14:15Z host app - - [a b="1"]',
+     ("host", "app", "", 5, 1)),
+    (b'<13>1 2003-10-11T22:14:15Z host app - - plain message',
+     ("host", "app", "plain message", 5, 1)),
+    (b'<34>Oct 11 22:14:15 mymachine su: \'su root\' failed',
+     ("mymachine", "su", "'su root' failed", 2, 4)),
+    (b'<30>Feb  5 17:32:18 router sshd[1234]: Accepted password',
+     ("router", "sshd", "Accepted password", 6, 3)),
+    (b'<30>Feb  5 17:32:18 router no app name here',
+     ("router", "unknown", "no app name here", 6, 3)),
+    (b'<13>caf\xc3\xa9 \xff',
+     ("unknown", "unknown", "café �", 5, 1)),
+    (b'not syslog at all',
+     ("unknown", "unknown", "not syslog at all", None, None)),
+    # Headers that differ only in whitespace must not share results
+    (b'1 X - - - - - ',
+     ("unknown", "unknown", "", None, None)),
+    (b'1  - - - - - ',
+     ("unknown", "unknown", "1  - - - - - ", None, None)),
+    (b'1 TS\tX h1 app1 - - - msg',
+     ("X", "h1", "- msg", None, None)),
+    (b'1 \tX h1 app1 - - - msg',
+     ("h1", "app1", "msg", None, None)),
+]
+
+PIECES = [
+    b" ", b"  ", b"\t", b"\n", b"-", b"- ", b"[", b"]", b"[a b=\"1\"]", b":", b": ",
+    b"[12]", b"[]", b"app", b"host", b"x" * 70, b"1 ", b"Oct 11 22:14:15 ",
+    b"Feb  5 01:02:03 ", b"\xff", b"caf\xc3\xa9", b"1", b"<", b">", b"<13>",
+]
+HEADS = [
+    b"<13>", b"<0>", b"<191>", b"<999>", b"<1a>", b"", b"<13>1 ",
+    b"<13>Oct 11 22:14:15 ", b"<13>1 2003-10-11T22:14:15Z h a p m ",
+]
+
+
+def python_parse(data):
+    """Parse a datagram with the pure Python parser."""
+    facility, severity, message_without_pri = parse_syslog_pri(data)
+    hostname, app_name, message = parse_syslog_message(message_without_pri)
+    return hostname, app_name, message, severity, facility
+
+
+def random_datagram(rng):
+    """Build a datagram from header and body fragments."""
+    return rng.choice(HEADS) + b"".join(rng.choice(PIECES) for _ in range(rng.randint(0, 10)))
+
+
+def main():
+    print("Testing syslog datagram parsing\n")
+
+    failures = 0
+    for data, expected in EXPECTED:
+        # Parse twice so any state kept between calls is exercised
+        for _ in range(2):
+            result = python_parse(data)
+            if result != expected:
+                failures += 1
+                print(f"✗ {data!r}: got {result}, expected {expected}")
+
+            if compiled_parse is not None and compiled_parse(data) != expected:
+                failures += 1
+                print(f"✗ {data!r}: compiled parser got {compiled_parse(data)}, expected {expected}")
+
+    print(f"Checked {len(EXPECTED)} known datagrams")
+
+    if compiled_parse is None:
+        print("Compiled _syslog_parse not built, skipping comparison")
+    else:
+        rng = random.Random(0)
+        for _ in range(20000):
+            data = random_datagram(rng)
+            if compiled_parse(data) != python_parse(data):
+                failures += 1
+                print(f"✗ {data!r}: compiled {compiled_parse(data)} != python {python_parse(data)}")
+        print("Compared compiled and Python parsers on 20000 random datagrams")
+
+    if failures == 0:
+        print("\n✓ SUCCESS: All parse results match!")
+    else:
+        print(f"\n✗ FAILURE: {failures} mismatched parse results")
+
+
+if __name__ == "__main__":
+    main()